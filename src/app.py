@@ -149,8 +149,11 @@ def main():
     """Main application function that handles the Streamlit interface."""
     st.title("Workout Analysis Dashboard")
     
-    # Initialize database connection
-    db = initialize_connection()
+    # Initialize database connection once per session so its date-range
+    # cache survives the reruns triggered by every sidebar change
+    if "db" not in st.session_state:
+        st.session_state.db = initialize_connection()
+    db = st.session_state.db
     
     # Sidebar controls
     st.sidebar.header("Analysis Controls")
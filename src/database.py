@@ -1,21 +1,191 @@
 from sqlalchemy import create_engine, Engine, text
 import pandas as pd
+import threading
+from collections import OrderedDict
 from datetime import datetime
-from typing import Union
+from typing import Callable, List, Optional, Tuple, Union
 
 class DatabaseError(Exception):
     """A simple wrapper for database-related errors."""
     pass
 
 
+class WorkoutDataCache:
+    """Date-interval cache of workout rows, kept per metric.
+
+    For each metric we remember which closed date intervals have already
+    been fetched, plus one DataFrame sorted by ``workout_date`` holding all
+    of their rows. Requests inside covered intervals are answered by slicing
+    that frame; only the uncovered gaps are fetched from the database.
+    """
+
+    def __init__(self, max_rows: int = 500_000):
+        """Initialize an empty cache.
+
+        Args:
+            max_rows: Total number of rows kept across all metrics. When the
+                cap is exceeded the least recently used metrics are evicted.
+        """
+        self.max_rows = max_rows
+        self._entries = OrderedDict()  # metric -> {'frame': ..., 'covered': [...]}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        metric_name: str,
+        fetch: Callable[[pd.Timestamp, pd.Timestamp], pd.DataFrame]
+    ) -> pd.DataFrame:
+        """Return rows between start_date and end_date (inclusive).
+
+        Args:
+            start_date: Start date for filtering
+            end_date: End date for filtering
+            metric_name: Metric the rows belong to
+            fetch: Callable returning rows for a closed (start, end) interval
+
+        Returns:
+            DataFrame with workout data, sorted by workout_date
+        """
+        start, end = pd.Timestamp(start_date), pd.Timestamp(end_date)
+        if start > end:
+            # Empty range: nothing worth caching, let the database answer
+            return fetch(start, end)
+
+        with self._lock:
+            entry = self._entries.get(metric_name)
+            if entry is None:
+                entry = {'frame': None, 'covered': []}
+                self._entries[metric_name] = entry
+            self._entries.move_to_end(metric_name)
+
+            self._fill_gaps(entry, start, end, fetch)
+            result = self._slice(entry['frame'], start, end)
+            self._evict(metric_name, start, end)
+
+        return result
+
+    def clear(self, metric_name: Optional[str] = None) -> None:
+        """Drop cached rows, e.g. after new workouts have been loaded.
+
+        Args:
+            metric_name: Only clear this metric; clears everything if None
+        """
+        with self._lock:
+            if metric_name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(metric_name, None)
+
+    @property
+    def total_rows(self) -> int:
+        """Number of rows currently held across all metrics."""
+        return sum(
+            len(entry['frame']) for entry in self._entries.values()
+            if entry['frame'] is not None
+        )
+
+    @staticmethod
+    def _find_gaps(
+        covered: List[Tuple[pd.Timestamp, pd.Timestamp]],
+        start: pd.Timestamp,
+        end: pd.Timestamp
+    ) -> List[Tuple[pd.Timestamp, pd.Timestamp]]:
+        """Find the closed intervals of [start, end] not yet fetched.
+
+        Gap bounds may touch an already covered interval; rows sitting
+        exactly on such a bound are filtered out after fetching.
+        """
+        gaps = []
+        cursor, cursor_covered = start, False
+        for low, high in covered:
+            if high < cursor:
+                continue
+            if low > end:
+                break
+            if low > cursor:
+                gaps.append((cursor, low))
+            cursor, cursor_covered = max(cursor, high), True
+        if cursor < end or not cursor_covered:
+            gaps.append((cursor, end))
+        return gaps
+
+    @staticmethod
+    def _merge_interval(
+        covered: List[Tuple[pd.Timestamp, pd.Timestamp]],
+        start: pd.Timestamp,
+        end: pd.Timestamp
+    ) -> List[Tuple[pd.Timestamp, pd.Timestamp]]:
+        """Add [start, end] to the sorted list of covered intervals."""
+        merged = []
+        for low, high in covered:
+            if high < start or low > end:
+                merged.append((low, high))
+            else:
+                start, end = min(start, low), max(end, high)
+        merged.append((start, end))
+        return sorted(merged)
+
+    @staticmethod
+    def _slice(frame: pd.DataFrame, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+        """Return a copy of the rows of a sorted frame within [start, end]."""
+        dates = frame['workout_date']
+        left = dates.searchsorted(start, side='left')
+        right = dates.searchsorted(end, side='right')
+        # Callers add columns to the result, so never hand out a view
+        return frame.iloc[left:right].reset_index(drop=True).copy()
+
+    def _fill_gaps(self, entry, start, end, fetch) -> None:
+        """Fetch the uncovered parts of [start, end] and merge them in."""
+        covered = entry['covered']
+        new_frames = []
+        for gap_start, gap_end in self._find_gaps(covered, start, end):
+            gap_df = fetch(gap_start, gap_end)
+            # Drop rows on gap bounds that are already cached
+            keep = pd.Series(True, index=gap_df.index)
+            for low, high in covered:
+                keep &= ~gap_df['workout_date'].between(low, high)
+            new_frames.append(gap_df[keep])
+
+        frames = [f for f in [entry['frame']] + new_frames if f is not None and not f.empty]
+        if frames:
+            merged = pd.concat(frames, ignore_index=True)
+        else:
+            # Keep the column layout even when there are no rows at all
+            merged = entry['frame'] if entry['frame'] is not None else new_frames[0]
+        entry['frame'] = merged.sort_values('workout_date', kind='mergesort').reset_index(drop=True)
+        entry['covered'] = self._merge_interval(covered, start, end)
+
+    def _evict(self, metric_name: str, start: pd.Timestamp, end: pd.Timestamp) -> None:
+        """Enforce max_rows, evicting least recently used metrics first."""
+        while self.total_rows > self.max_rows and len(self._entries) > 1:
+            oldest = next(iter(self._entries))
+            if oldest == metric_name:
+                break
+            del self._entries[oldest]
+
+        # The current metric alone is too large: keep only the requested window
+        entry = self._entries[metric_name]
+        if self.total_rows > self.max_rows and entry['frame'] is not None:
+            entry['frame'] = self._slice(entry['frame'], start, end)
+            entry['covered'] = [(start, end)]
+
+
 class DatabaseConnection:
     """Handles database connections and queries for workout data."""
     
-    def __init__(self, connection: Union[str, Engine]):
+    def __init__(
+        self,
+        connection: Union[str, Engine],
+        cache_max_rows: Optional[int] = 500_000
+    ):
         """Initialize database connection.
         
         Args:
             connection: Either a SQLAlchemy connection string or engine
+            cache_max_rows: Row cap for the date-range cache, or None to
+                disable caching
         """
         try:
             print(f"Attempting to initialize with connection: {connection}")
@@ -30,6 +200,8 @@ class DatabaseConnection:
             self.is_sqlite = 'sqlite' in str(self.engine.url)
             print(f"Database type: {'SQLite' if self.is_sqlite else 'MySQL'}")
 
+            self.cache = WorkoutDataCache(cache_max_rows) if cache_max_rows is not None else None
+
         except Exception as e:
             
             raise DatabaseError(f"Failed to initialize database : {str(e)}")
@@ -55,6 +227,9 @@ class DatabaseConnection:
     ) -> pd.DataFrame:
         """Retrieve workout data for specified date range.
         
+        When caching is enabled, only the parts of the range that have not
+        been fetched before are queried; the rest is served from memory.
+        
         Args:
             start_date: Start date for filtering
             end_date: End date for filtering
@@ -63,13 +238,32 @@ class DatabaseConnection:
         Returns:
             DataFrame with workout data
         """
-        # Adjust table name based on database type
-        table_name = "workout_summary" if self.is_sqlite else "sweat.workout_summary"
-        
         # Since we can't parameterize column names in SQL, we'll validate the metric_name
         valid_metrics = {'distance_mi', 'duration_sec', 'kcal_burned', 'avg_pace', 'max_pace','steps'}
         if metric_name not in valid_metrics:
             raise ValueError(f"Invalid metric name. Must be one of: {valid_metrics}")
+
+        if self.cache is None:
+            return self._query_workout_data(start_date, end_date, metric_name)
+
+        return self.cache.get(
+            start_date,
+            end_date,
+            metric_name,
+            fetch=lambda start, end: self._query_workout_data(
+                start.to_pydatetime(), end.to_pydatetime(), metric_name
+            )
+        )
+
+    def _query_workout_data(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        metric_name: str
+    ) -> pd.DataFrame:
+        """Run the date range query against the database (no caching)."""
+        # Adjust table name based on database type
+        table_name = "workout_summary" if self.is_sqlite else "sweat.workout_summary"
         
         query = text(f"""
             SELECT 
@@ -0,0 +1,335 @@
+"""Headless load harness for the dashboard's fetch-and-aggregate path.
+
+Simulates concurrent users replaying sidebar interactions (date range,
+metric, period, aggregation type) against a seeded local SQLite database and
+reports throughput and p50/p95/p99 latency for each stage of the app.
+
+Run it the same way as the dashboard, from the repository root:
+
+    python src/load_harness.py --users 8 --interactions 50 --mode thread
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+import numpy as np
+from sqlalchemy import create_engine, text
+
+from database import DatabaseConnection
+from analytics import WorkoutAnalytics
+from app import create_histogram, analyze_workout_distribution
+
+# Sidebar choices, using the internal codes the app converts them to
+METRICS = ["distance_mi", "duration_sec", "kcal_burned", "avg_pace", "max_pace", "steps"]
+PERIODS = ["W", "M"]
+AGG_TYPES = {"Total": "sum", "Average": "mean", "Standard Deviation": "std"}
+
+STAGES = ["fetch", "aggregate", "histogram", "distribution", "total"]
+
+
+def seed_database(
+    db_path: str,
+    start_date: datetime = datetime(2019, 1, 1),
+    days: int = 365 * 3,
+    seed: int = 42
+) -> str:
+    """Create a SQLite database filled with random workouts.
+
+    Args:
+        db_path: File to write the database to
+        start_date: Date of the first workout
+        days: Number of days of workouts to generate
+        seed: Random seed, so runs are comparable
+
+    Returns:
+        SQLAlchemy connection string for the new database
+    """
+    rng = random.Random(seed)
+    rows = []
+    for day in range(days):
+        # Zero to two workouts per day
+        for _ in range(rng.choice([0, 1, 1, 2])):
+            distance = round(rng.uniform(1.0, 10.0), 2)
+            duration = int(distance * rng.uniform(480, 720))
+            rows.append({
+                "workout_date": start_date + timedelta(days=day, hours=rng.randint(5, 20)),
+                "activity_type": rng.choice(["run", "walk", "bike"]),
+                "distance_mi": distance,
+                "duration_sec": duration,
+                "kcal_burned": int(distance * rng.uniform(90, 120)),
+                "avg_pace": round(duration / 60 / distance, 2),
+                "max_pace": round(duration / 60 / distance * rng.uniform(0.7, 0.95), 2),
+                "steps": int(distance * rng.uniform(1800, 2300)),
+            })
+
+    connection_string = f"sqlite:///{db_path}"
+    engine = create_engine(connection_string)
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE IF EXISTS workout_summary"))
+        conn.execute(text("""
+            CREATE TABLE workout_summary (
+                workout_date DATETIME,
+                activity_type VARCHAR(50),
+                distance_mi FLOAT,
+                duration_sec INTEGER,
+                kcal_burned INTEGER,
+                avg_pace FLOAT,
+                max_pace FLOAT,
+                steps INTEGER
+            )
+        """))
+        conn.execute(text("""
+            INSERT INTO workout_summary
+            (workout_date, activity_type, distance_mi, duration_sec,
+             kcal_burned, avg_pace, max_pace, steps)
+            VALUES
+            (:workout_date, :activity_type, :distance_mi, :duration_sec,
+             :kcal_burned, :avg_pace, :max_pace, :steps)
+        """), rows)
+    engine.dispose()
+
+    return connection_string
+
+
+def generate_interactions(
+    count: int,
+    data_start: datetime,
+    data_end: datetime,
+    seed: int = 0
+) -> List[Dict]:
+    """Generate a realistic sequence of sidebar selections for one user.
+
+    Most interactions nudge the start or end date by a few days; the rest
+    switch the metric, period or aggregation type.
+
+    Args:
+        count: Number of interactions to generate
+        data_start: Earliest selectable date
+        data_end: Latest selectable date
+        seed: Random seed for this user
+
+    Returns:
+        List of dicts with start_date, end_date, metric, period and agg_type
+    """
+    rng = random.Random(seed)
+
+    # Same default window as the app: the last year of data
+    end_date = data_end
+    start_date = max(data_start, end_date - timedelta(days=365))
+    metric, period, agg_type = METRICS[0], PERIODS[0], "Total"
+
+    interactions = []
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.4:
+            start_date += timedelta(days=rng.randint(-7, 7))
+        elif roll < 0.6:
+            end_date += timedelta(days=rng.randint(-7, 7))
+        elif roll < 0.8:
+            metric = rng.choice(METRICS)
+        elif roll < 0.9:
+            period = rng.choice(PERIODS)
+        else:
+            agg_type = rng.choice(list(AGG_TYPES))
+
+        # Respect the sidebar's min/max constraints
+        end_date = min(max(end_date, data_start), data_end)
+        start_date = min(max(start_date, data_start), end_date)
+
+        interactions.append({
+            "start_date": start_date,
+            "end_date": end_date,
+            "metric": metric,
+            "period": period,
+            "agg_type": agg_type,
+        })
+
+    return interactions
+
+
+def run_user(
+    connection_string: str,
+    interactions: List[Dict],
+    cache_max_rows: Optional[int] = 500_000
+) -> Dict[str, List[float]]:
+    """Replay one user's interactions the way ``main()`` processes them.
+
+    Args:
+        connection_string: Database to query
+        interactions: Output of generate_interactions
+        cache_max_rows: Passed to DatabaseConnection; None disables caching
+
+    Returns:
+        Dict mapping each stage name to its latencies in seconds
+    """
+    # One connection per user, like one Streamlit session
+    db = DatabaseConnection(connection_string, cache_max_rows=cache_max_rows)
+    timings = {stage: [] for stage in STAGES}
+
+    for interaction in interactions:
+        metric = interaction["metric"]
+        began = time.perf_counter()
+
+        df = db.get_workout_data(
+            start_date=interaction["start_date"],
+            end_date=interaction["end_date"],
+            metric_name=metric
+        )
+        fetched = time.perf_counter()
+        timings["fetch"].append(fetched - began)
+
+        if df.empty:
+            # The app stops here with a warning
+            timings["total"].append(fetched - began)
+            continue
+
+        WorkoutAnalytics.aggregate_by_period(
+            df,
+            metric=metric,
+            agg_type=AGG_TYPES[interaction["agg_type"]],
+            period=interaction["period"]
+        )
+        aggregated = time.perf_counter()
+        timings["aggregate"].append(aggregated - fetched)
+
+        create_histogram(df, metric, interaction["agg_type"])
+        plotted = time.perf_counter()
+        timings["histogram"].append(plotted - aggregated)
+
+        analyze_workout_distribution(df, metric)
+        finished = time.perf_counter()
+        timings["distribution"].append(finished - plotted)
+        timings["total"].append(finished - began)
+
+    db.engine.dispose()
+    return timings
+
+
+def summarize(timings: List[Dict[str, List[float]]], wall_time: float) -> Dict[str, Dict]:
+    """Combine per-user timings into throughput and latency percentiles.
+
+    Args:
+        timings: One run_user result per simulated user
+        wall_time: Seconds the whole run took
+
+    Returns:
+        Dict mapping each stage to count, throughput (ops/s) and
+        p50/p95/p99 latency in milliseconds
+    """
+    report = {}
+    for stage in STAGES:
+        samples = np.array([t for user in timings for t in user[stage]]) * 1000
+        if samples.size:
+            p50, p95, p99 = np.percentile(samples, [50, 95, 99])
+        else:
+            p50 = p95 = p99 = float("nan")
+        report[stage] = {
+            "count": int(samples.size),
+            "throughput": samples.size / wall_time if wall_time > 0 else float("nan"),
+            "p50_ms": float(p50),
+            "p95_ms": float(p95),
+            "p99_ms": float(p99),
+        }
+    return report
+
+
+def run_load_test(
+    connection_string: str,
+    data_start: datetime,
+    data_end: datetime,
+    users: int = 4,
+    interactions: int = 20,
+    mode: str = "thread",
+    seed: int = 0,
+    cache_max_rows: Optional[int] = 500_000
+) -> Dict[str, Dict]:
+    """Simulate concurrent users and measure each stage of the data path.
+
+    Args:
+        connection_string: Seeded database to query
+        data_start: Earliest date users may select
+        data_end: Latest date users may select
+        users: Number of concurrent users
+        interactions: Interactions replayed by each user
+        mode: 'thread' or 'process'
+        seed: Base random seed; user i uses seed + i
+        cache_max_rows: Passed to DatabaseConnection; None disables caching
+
+    Returns:
+        Report as produced by summarize
+    """
+    executors = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}
+    if mode not in executors:
+        raise ValueError(f"Invalid mode. Must be one of: {set(executors)}")
+
+    sessions = [
+        generate_interactions(interactions, data_start, data_end, seed=seed + i)
+        for i in range(users)
+    ]
+
+    began = time.perf_counter()
+    with executors[mode](max_workers=users) as pool:
+        futures = [
+            pool.submit(run_user, connection_string, session, cache_max_rows)
+            for session in sessions
+        ]
+        timings = [future.result() for future in futures]
+    wall_time = time.perf_counter() - began
+
+    return summarize(timings, wall_time)
+
+
+def format_report(report: Dict[str, Dict]) -> str:
+    """Render a report as a plain text table."""
+    lines = [f"{'stage':<14}{'count':>8}{'ops/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"]
+    for stage, stats in report.items():
+        lines.append(
+            f"{stage:<14}{stats['count']:>8}{stats['throughput']:>10.1f}"
+            f"{stats['p50_ms']:>10.2f}{stats['p95_ms']:>10.2f}{stats['p99_ms']:>10.2f}"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=4, help="concurrent users")
+    parser.add_argument("--interactions", type=int, default=20, help="interactions per user")
+    parser.add_argument("--mode", choices=["thread", "process"], default="thread")
+    parser.add_argument("--days", type=int, default=365 * 3, help="days of seeded workouts")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-cache", action="store_true", help="disable the date-range cache")
+    args = parser.parse_args()
+
+    data_start = datetime(2019, 1, 1)
+    data_end = data_start + timedelta(days=args.days)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        connection_string = seed_database(
+            os.path.join(tmp_dir, "workouts.db"),
+            start_date=data_start,
+            days=args.days,
+            seed=args.seed
+        )
+        report = run_load_test(
+            connection_string,
+            data_start,
+            data_end,
+            users=args.users,
+            interactions=args.interactions,
+            mode=args.mode,
+            seed=args.seed,
+            cache_max_rows=None if args.no_cache else 500_000
+        )
+
+    print(f"\n{args.users} {args.mode} users x {args.interactions} interactions")
+    print(format_report(report))
+
+
+if __name__ == "__main__":
+    main()
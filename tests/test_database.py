@@ -2,7 +2,8 @@ import pytest
 from datetime import datetime
 import pandas as pd
 from sqlalchemy import create_engine, text
-from src.database import DatabaseConnection, DatabaseError
+from unittest.mock import patch
+from src.database import DatabaseConnection, DatabaseError, WorkoutDataCache
 
 @pytest.fixture
 def test_db():
@@ -101,4 +102,50 @@ def test_get_workout_data(db_connection):
     assert len(df) == 2
     assert 'workout_date' in df.columns
     assert 'distance_mi' in df.columns
-    assert df['distance_mi'].sum() == 8.1  # 3.1 + 5.0
\ No newline at end of file
+    assert df['distance_mi'].sum() == 8.1  # 3.1 + 5.0
+
+def test_get_workout_data_serves_sub_range_from_cache(db_connection):
+    """Test that a range inside an already fetched range skips the database."""
+    db_connection.get_workout_data(datetime(2024, 1, 1), datetime(2024, 1, 3))
+
+    with patch.object(db_connection, '_query_workout_data') as mock_query:
+        df = db_connection.get_workout_data(datetime(2024, 1, 2), datetime(2024, 1, 3))
+
+    assert not mock_query.called
+    assert len(df) == 1
+    assert df['distance_mi'].sum() == 5.0
+
+
+def test_get_workout_data_fetches_only_missing_gap(db_connection):
+    """Test that shifting the range only queries the uncovered dates."""
+    db_connection.get_workout_data(datetime(2024, 1, 2), datetime(2024, 1, 3))
+
+    with patch.object(
+        db_connection, '_query_workout_data', wraps=db_connection._query_workout_data
+    ) as mock_query:
+        df = db_connection.get_workout_data(datetime(2024, 1, 1), datetime(2024, 1, 3))
+
+    mock_query.assert_called_once_with(
+        datetime(2024, 1, 1), datetime(2024, 1, 2), 'distance_mi'
+    )
+    assert len(df) == 2
+    assert df['distance_mi'].sum() == 8.1
+
+
+def test_workout_data_cache_evicts_least_recently_used():
+    """Test that the row cap evicts the least recently used metric."""
+    cache = WorkoutDataCache(max_rows=3)
+    frame = pd.DataFrame({
+        'workout_date': pd.date_range(start='2024-01-01', periods=2, freq='D'),
+        'activity_type': ['run', 'run'],
+        'value': [1.0, 2.0]
+    })
+
+    def fetch(start, end):
+        return frame[frame['workout_date'].between(start, end)]
+
+    cache.get(datetime(2024, 1, 1), datetime(2024, 1, 2), 'distance_mi', fetch)
+    cache.get(datetime(2024, 1, 1), datetime(2024, 1, 2), 'steps', fetch)
+
+    assert cache.total_rows == 2
+    assert list(cache._entries) == ['steps']
@@ -0,0 +1,54 @@
+import pytest
+from datetime import datetime, timedelta
+from src.load_harness import (
+    seed_database, generate_interactions, summarize, run_load_test, STAGES
+)
+
+@pytest.fixture
+def seeded_db(tmp_path):
+    """Create a small seeded SQLite database."""
+    return seed_database(str(tmp_path / "workouts.db"), start_date=datetime(2024, 1, 1), days=60)
+
+
+def test_generate_interactions_respects_date_bounds():
+    """Test that generated selections stay within the selectable range."""
+    data_start, data_end = datetime(2024, 1, 1), datetime(2024, 3, 1)
+    interactions = generate_interactions(100, data_start, data_end, seed=1)
+
+    assert len(interactions) == 100
+    for interaction in interactions:
+        assert data_start <= interaction["start_date"] <= interaction["end_date"] <= data_end
+
+
+def test_summarize_percentiles():
+    """Test throughput and latency percentiles of combined timings."""
+    timings = [{stage: [0.001 * i for i in range(1, 51)] for stage in STAGES},
+               {stage: [0.001 * i for i in range(51, 101)] for stage in STAGES}]
+
+    report = summarize(timings, wall_time=2.0)
+
+    assert report["fetch"]["count"] == 100
+    assert report["fetch"]["throughput"] == 50.0
+    assert abs(report["fetch"]["p50_ms"] - 50.5) < 0.01
+    assert report["fetch"]["p50_ms"] <= report["fetch"]["p95_ms"] <= report["fetch"]["p99_ms"]
+
+
+def test_run_load_test_threads(seeded_db):
+    """Test a short threaded run reports every stage."""
+    report = run_load_test(
+        seeded_db,
+        datetime(2024, 1, 1),
+        datetime(2024, 1, 1) + timedelta(days=60),
+        users=2,
+        interactions=3
+    )
+
+    assert set(report) == set(STAGES)
+    assert report["fetch"]["count"] == 6
+    assert report["total"]["count"] == 6
+
+
+def test_run_load_test_invalid_mode(seeded_db):
+    """Test that an unknown concurrency mode is rejected."""
+    with pytest.raises(ValueError):
+        run_load_test(seeded_db, datetime(2024, 1, 1), datetime(2024, 3, 1), mode="fibers")